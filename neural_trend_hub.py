@@ -1,16 +1,93 @@
-from langchain_ollama import OllamaLLM
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import urllib.parse
-import requests
 import datetime
+import functools
+import hashlib
+import html
+import itertools
+import codecs
 import logging
 import json
+import threading
+import time
 import re
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure basic logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+# Runs of non-word characters, replaced by a single underscore in to_snake_case
+_SNAKE_RE = re.compile(r'\W+')
+
+# CSS selectors for a Google News result card and its fields
+_SEL_ITEM = "div.SoaBEf"
+_SEL_LINK = "a[href]"
+_SEL_TITLE = "div.MBeuO"
+_SEL_SNIPPET = ".GI74Re"
+_SEL_DATE = ".LfVVr"
+_SEL_SOURCE = ".NUnG9d span"
+# Class name every result card carries, checked on the raw bytes before parsing
+_CARD_MARKER = b"SoaBEf"
+
+# Regex fast path over the raw UTF-8 page: each card runs from one SoaBEf opening tag
+# to the next, and every field must be found in it or the page is parsed instead.
+# Class names are matched as whole class tokens, like the CSS selectors (SoaBEf-x is not SoaBEf)
+_CARD_START_RE = re.compile(rb'<div[^>]*\sclass="[^"]*(?<![\w-])SoaBEf(?![\w-])')
+_FAST_FIELD_RES = {
+    # href must be a whole attribute name, not the tail of one such as data-href
+    "link": re.compile(rb'<a\s(?:[^>]*?\s)?href="(?P<value>[^"]*)"'),
+    "title": re.compile(rb'<(?P<tag>\w+)[^>]*\sclass="[^"]*(?<![\w-])MBeuO(?![\w-])[^"]*"[^>]*>(?P<value>.*?)</(?P=tag)>', re.DOTALL),
+    "snippet": re.compile(rb'<(?P<tag>\w+)[^>]*\sclass="[^"]*(?<![\w-])GI74Re(?![\w-])[^"]*"[^>]*>(?P<value>.*?)</(?P=tag)>', re.DOTALL),
+    "date": re.compile(rb'<(?P<tag>\w+)[^>]*\sclass="[^"]*(?<![\w-])LfVVr(?![\w-])[^"]*"[^>]*>(?P<value>.*?)</(?P=tag)>', re.DOTALL),
+    # First span anywhere inside the NUnG9d element (the favicon <g-img> comes before it),
+    # without running past the element's own closing tag
+    "source": re.compile(
+        rb'<(?P<outer>\w+)[^>]*\sclass="[^"]*(?<![\w-])NUnG9d(?![\w-])[^"]*"[^>]*>'
+        rb'(?:(?!</(?P=outer)>|<span[\s>]).)*<(?P<tag>span)(?:\s[^>]*)?>(?P<value>.*?)</span>',
+        re.DOTALL
+    ),
+}
+_TAG_RE = re.compile(rb"<[^>]*>")
+
+# Relative dates shown on result cards, e.g. "2 hours ago" or "hace 3 días"
+_RELATIVE_DATE_RE = re.compile(r"(\d+)\s+(minute|min|hour|hora|day|día|dia|week|semana|month|mes|year|año)", re.IGNORECASE)
+_RELATIVE_DATE_UNITS = {
+    "minute": ("minutes", 1), "min": ("minutes", 1),
+    "hour": ("hours", 1), "hora": ("hours", 1),
+    "day": ("days", 1), "día": ("days", 1), "dia": ("days", 1),
+    "week": ("weeks", 1), "semana": ("weeks", 1),
+    "month": ("days", 30), "mes": ("days", 30),
+    "year": ("days", 365), "año": ("days", 365),
+}
+
+# Upper bound on the decoded size of a results page; larger bodies (error pages,
+# captchas) are cut off instead of being held in memory and parsed in full
+MAX_RESPONSE_BYTES = 4 * 1024 * 1024
+
+# Scraped results are reused for this many seconds within the same day
+try:
+    SCRAPE_CACHE_TTL = int(os.environ.get("NEURAL_TREND_HUB_CACHE_TTL", 3600))
+except ValueError:
+    logging.warning("NEURAL_TREND_HUB_CACHE_TTL is not an integer number of seconds, using the default of 3600.")
+    SCRAPE_CACHE_TTL = 3600
+
+# Semantic report cache: a previous report is reused when the embedding of the new
+# news titles is at least this similar to the one it was generated from
+SEMANTIC_CACHE_MODEL = "all-MiniLM-L6-v2"
+SEMANTIC_CACHE_THRESHOLD = 0.97
+SEMANTIC_CACHE_MAX_ENTRIES = 100
+_embedder = None
+_embedder_lock = threading.Lock()
+
+# Shared HTTP session, created on first use by get_session
+_session = None
+_session_lock = threading.Lock()
+
 def to_snake_case(text):
     """
     Convert a string to snake_case.
@@ -21,14 +98,45 @@ def to_snake_case(text):
     Returns:
         str: The text converted to snake_case.
     """
-    text = text.lower().strip()
-    text = re.sub(r'\W+', '_', text)
-    return text
+    return _SNAKE_RE.sub('_', text.lower().strip())
+
+@functools.lru_cache(maxsize=32)
+def _static_query_tail(location, language, num_results):
+    """
+    Build the part of the Google News query string that does not depend on the search term or dates.
+    
+    Parameters:
+        location (str): Geographic location code (e.g., "co" for Colombia).
+        language (str): Language code (e.g., "es" for Spanish).
+        num_results (int): Number of results to request.
+    
+    Returns:
+        str: The query string tail, starting with "&".
+    """
+    return f"&gl={location}&hl={language}&tbm=nws&num={num_results}"
+
+def _format_google_news_url(encoded_query, cd_min, cd_max, query_tail):
+    """
+    Assemble a Google News search URL from already encoded and formatted parts.
+    
+    Parameters:
+        encoded_query (str): The search term, encoded with urllib.parse.quote_plus.
+        cd_min (str): The start date formatted as mm/dd/yyyy.
+        cd_max (str): The end date formatted as mm/dd/yyyy.
+        query_tail (str): The static query string tail from _static_query_tail.
+    
+    Returns:
+        str: The constructed URL.
+    """
+    return f"https://www.google.com/search?q={encoded_query}&tbs=cdr:1,cd_min:{cd_min},cd_max:{cd_max}{query_tail}"
 
+@functools.lru_cache(maxsize=256)
 def build_google_news_url(query, start_date, end_date, num_results, location, language):
     """
     Build the Google News search URL using a specific query, date range, location, and language.
     
+    Results are memoized, so repeated calls with the same arguments return the cached URL.
+    
     Parameters:
         query (str): The search term.
         start_date (datetime.date): The start date for filtering news.
@@ -40,27 +148,300 @@ def build_google_news_url(query, start_date, end_date, num_results, location, la
     Returns:
         str: The constructed URL.
     """
-    base_url = "https://www.google.com/search"
     # Format dates as mm/dd/yyyy
     cd_min = start_date.strftime("%m/%d/%Y")
     cd_max = end_date.strftime("%m/%d/%Y")
     
-    params = {
-        'q': query,
-        'gl': location,      # geographic location code (e.g., "co")
-        'hl': language,      # language code (e.g., "es")
-        'tbm': 'nws',
-        'num': str(num_results),
-        'tbs': f"cdr:1,cd_min:{cd_min},cd_max:{cd_max}"
-    }
+    return _format_google_news_url(
+        urllib.parse.quote_plus(query), cd_min, cd_max, _static_query_tail(location, language, num_results)
+    )
+
+def get_session():
+    """
+    Get the shared HTTP session used for every Google request, creating it on first use.
+    
+    requests is only imported here, so importing this module stays cheap when nothing is scraped.
+    
+    Returns:
+        requests.Session: A session that reuses pooled TCP+TLS connections.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            session = requests.Session()
+            session.headers.update({
+                "User-Agent":
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                "(KHTML, like Gecko) Chrome/101.0.4951.54 Safari/537.36"
+            })
+            # Pooled connections for the concurrently requested date ranges, with a short
+            # backoff on rate limiting and transient server errors
+            session.mount("https://", HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=8,
+                max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+            ))
+            _session = session
+    return _session
+
+def read_response_body(response, limit):
+    """
+    Read a streamed response body, stopping once it grows past a size limit.
+    
+    Parameters:
+        response (requests.Response): A response requested with stream=True.
+        limit (int): Maximum number of bytes to keep.
+        
+    Returns:
+        bytes: The (possibly truncated) decompressed body.
+    """
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size=65536):
+        body += chunk
+        if len(body) > limit:
+            logging.warning(f"Response is larger than {limit} bytes, truncating it.")
+            del body[limit:]
+            break
+    return bytes(body)
+
+def get_response_html(response, body):
+    """
+    Get the body of a results page in a form the parser reads without encoding detection.
+    
+    Google serves UTF-8, which Lexbor parses directly from the raw bytes. Only pages that
+    declare a different charset are decoded first.
+    
+    Parameters:
+        response (requests.Response): The HTTP response for a results page.
+        body (bytes): The body read from the response.
+        
+    Returns:
+        bytes or str: The raw UTF-8 body, or the body decoded with the declared charset.
+    """
+    # Without an explicit charset requests assumes ISO-8859-1, Google means UTF-8
+    if "charset=" not in response.headers.get("Content-Type", "").lower():
+        return body
+    try:
+        encoding = codecs.lookup(response.encoding).name
+    except LookupError:
+        return body
+    if encoding == "utf-8":
+        return body
+    return body.decode(encoding, errors="replace")
+
+def extract_news_card(el):
+    """
+    Extract the news data from a single Google News result card.
+    
+    Parameters:
+        el (selectolax.lexbor.LexborNode): The div.SoaBEf card node.
+        
+    Returns:
+        dict or None: The link, title, snippet, date and source of the article, or None if the card could not be parsed.
+    """
+    try:
+        # Look each field up once and reuse the node for the guard and the text
+        link_node = el.css_first(_SEL_LINK)
+        title_node = el.css_first(_SEL_TITLE)
+        snippet_node = el.css_first(_SEL_SNIPPET)
+        date_node = el.css_first(_SEL_DATE)
+        source_node = el.css_first(_SEL_SOURCE)
+        # attrs reads a single attribute, attributes would copy all of them into a dict
+        return {
+            "link": link_node.attrs["href"] if link_node else "",
+            "title": title_node.text() if title_node else "",
+            "snippet": snippet_node.text() if snippet_node else "",
+            "date": date_node.text() if date_node else "",
+            "source": source_node.text() if source_node else ""
+        }
+    except Exception as parse_error:
+        logging.warning(f"Error parsing an element: {parse_error}")
+        return None
+
+def extract_news_cards_fast(page):
+    """
+    Extract the result cards from a UTF-8 results page with regular expressions, without building a DOM.
+    
+    Parameters:
+        page (bytes): The raw UTF-8 body of a results page.
+        
+    Returns:
+        list or None: A list of dictionaries containing news data, or None if any card does not
+        have the expected markup and the page has to be parsed instead.
+    """
+    starts = [match.start() for match in _CARD_START_RE.finditer(page)]
+    if not starts:
+        return None
+    
+    news_results = []
+    for begin, end in zip(starts, starts[1:] + [len(page)]):
+        card_html = page[begin:end]
+        card = {}
+        for field, pattern in _FAST_FIELD_RES.items():
+            match = pattern.search(card_html)
+            if match is None:
+                return None
+            value = match.group("value")
+            # A nested element of the same tag would end the match too early
+            tag = match.groupdict().get("tag")
+            if tag is not None and b"<" + tag in value:
+                return None
+            value = _TAG_RE.sub(b"", value).decode("utf-8", errors="replace")
+            card[field] = html.unescape(value)
+        news_results.append(card)
+    return news_results
+
+def fetch_news_page(url, language):
+    """
+    Fetch a single Google News results page and extract its news articles.
+    
+    Parameters:
+        url (str): The Google News search URL.
+        language (str): Language code sent as the preferred Accept-Language (e.g., "es").
+        
+    Returns:
+        list or None: A list of dictionaries containing news data, or None if the request failed.
+    """
+    import requests
+    
+    try:
+        # The session advertises gzip, and br when brotli is installed, so the page arrives compressed
+        response = get_session().get(
+            url, headers={"Accept-Language": f"{language};q=0.9"}, timeout=10, stream=True
+        )
+        with response:
+            response.raise_for_status()
+            body = read_response_body(response, MAX_RESPONSE_BYTES)
+    except requests.exceptions.RequestException as e:
+        logging.error(f"Request failed: {e}")
+        return None
+    
+    # Pages without a single result card (no results, consent or captcha pages) are not worth parsing
+    if _CARD_MARKER not in body:
+        logging.info("No result cards found in the response, skipping the parse.")
+        return []
+    
+    page = get_response_html(response, body)
+    if isinstance(page, bytes):
+        news_results = extract_news_cards_fast(page)
+        if news_results is not None:
+            return news_results
+        logging.info("Result cards have unexpected markup, falling back to the HTML parser.")
+    
+    # Imported here so that pages handled by the fast path never load the parser
+    from selectolax.lexbor import LexborHTMLParser
+    
+    tree = LexborHTMLParser(page)
+    # Use the card selectors defined at module level to extract news data
+    cards = (extract_news_card(el) for el in tree.css(_SEL_ITEM))
+    news_results = [card for card in cards if card is not None]
+    
+    return news_results
+
+def parse_news_date(date_text, now=None):
+    """
+    Parse the date shown on a Google News result card.
+    
+    Handles relative dates in English and Spanish (e.g., "2 hours ago", "hace 3 días"),
+    "yesterday"/"ayer", and absolute English dates such as "Mar 3, 2025". Absolute dates
+    in other languages (e.g., "3 ene 2025") are not parsed and return None, so those
+    cards only count toward the widest range in single_request mode.
+    
+    Parameters:
+        date_text (str): The date text extracted from the card.
+        now (datetime.datetime): Reference time for relative dates (default: current time).
+        
+    Returns:
+        datetime.date or None: The publication date, or None if the text could not be parsed.
+    """
+    now = now or datetime.datetime.now()
+    text = date_text.strip().lower()
+    
+    match = _RELATIVE_DATE_RE.search(text)
+    if match:
+        unit, multiplier = _RELATIVE_DATE_UNITS[match.group(2).lower()]
+        return (now - datetime.timedelta(**{unit: int(match.group(1)) * multiplier})).date()
+    if text in ("yesterday", "ayer"):
+        return (now - datetime.timedelta(days=1)).date()
+    
+    for date_format in ("%b %d, %Y", "%d %b %Y"):
+        try:
+            return datetime.datetime.strptime(date_text.strip(), date_format).date()
+        except ValueError:
+            continue
+    return None
+
+def filter_news_by_date(news_results, start_date):
+    """
+    Keep only the articles published on or after a given date.
+    
+    Parameters:
+        news_results (list): List of dictionaries containing news data.
+        start_date (datetime.date): The earliest publication date to keep.
+        
+    Returns:
+        list: The articles whose date could be parsed and is not before start_date.
+    """
+    filtered = []
+    for article in news_results:
+        published = parse_news_date(article["date"])
+        if published is not None and published >= start_date:
+            filtered.append(article)
+    return filtered
+
+def load_cached_news(cache_file, ttl):
+    """
+    Load scraped news results from the disk cache if they are recent enough.
+    
+    Parameters:
+        cache_file (str): Path to the cached results JSON file.
+        ttl (int): Maximum age of the cache file in seconds.
+        
+    Returns:
+        tuple or None: (news, start_date, end_date) as returned by scrape_google_news, or None on a miss.
+    """
+    if not os.path.exists(cache_file) or time.time() - os.path.getmtime(cache_file) > ttl:
+        return None
+    # An unreadable or old-format entry is a miss, so the next scrape overwrites it
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        return (
+            cached["news"],
+            datetime.date.fromisoformat(cached["start_date"]),
+            datetime.date.fromisoformat(cached["end_date"]),
+        )
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logging.warning(f"Ignoring unreadable cache file {cache_file}: {e}")
+        return None
+
+def save_cached_news(cache_file, news, start_date, end_date):
+    """
+    Store scraped news results in the disk cache.
     
-    url = f"{base_url}?{urllib.parse.urlencode(params)}"
-    return url
+    Parameters:
+        cache_file (str): Path to the cached results JSON file.
+        news (list): List of dictionaries containing news data.
+        start_date (datetime.date): The start date used.
+        end_date (datetime.date): The end date used.
+    """
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    cached = {"news": news, "start_date": start_date.isoformat(), "end_date": end_date.isoformat()}
+    write_file_atomically(cache_file, json.dumps(cached, ensure_ascii=False))
 
-def scrape_google_news(search_term, location="co", language="es", min_results=10, expected_results=100, days=1):
+def scrape_google_news(search_term, location="co", language="es", min_results=10, expected_results=100, days=1,
+                       single_request=False, cache_folder=".cache"):
     """
     Scrape Google News for a given search term with dynamic date range expansion if necessary.
     
+    All candidate date ranges are requested concurrently, and the shortest range that
+    returns at least min_results articles is used. With single_request, only the widest
+    range is requested and the narrower ranges are filtered from the dates on its cards.
+    
     Parameters:
         search_term (str): The search term to query.
         location (str): Geographic location code (default "co" for Colombia).
@@ -68,61 +449,83 @@ def scrape_google_news(search_term, location="co", language="es", min_results=10
         min_results (int): Minimum number of results required (default 10).
         expected_results (int): Expected number of results per page (default 100).
         days (int): Initial number of days in the past to include news (default 1).
+        single_request (bool): Fetch only the widest date range and filter it client-side (default False).
+            Cards whose date cannot be parsed (e.g., non-English absolute dates) are left out of the narrower ranges.
+        cache_folder (str): Folder for same-day cached results, or None to disable caching (default ".cache").
         
     Returns:
         tuple: (final_news, used_start_date, used_end_date)
             - final_news (list): A list of dictionaries containing news data.
             - used_start_date (datetime.date): The start date used.
             - used_end_date (datetime.date): The end date used.
+            If no date range could be retrieved, ([], None, None) is returned.
     """
+    cache_file = None
+    if cache_folder is not None:
+        # The digest identifies the entry (raw search term and every option), the snake_cased
+        # term in the name is only there for people browsing the cache folder
+        key = "\x00".join(map(str, (search_term, location, language, min_results, expected_results, days, single_request)))
+        options = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        cache_file = os.path.join(
+            cache_folder,
+            f"{to_snake_case(search_term)}_{location}_{language}_{datetime.date.today().isoformat()}_{options}.json"
+        )
+        cached = load_cached_news(cache_file, SCRAPE_CACHE_TTL)
+        if cached is not None:
+            logging.info(f"Using cached results from {cache_file}.")
+            return cached
+    
     candidate_ranges = [days, 7, 30, 90]
     final_news = []
     used_range = None
-
+    
+    # Only the dates change between ranges, so encode the query and the static parameters once
+    encoded_query = urllib.parse.quote_plus(search_term)
+    query_tail = _static_query_tail(location, language, expected_results)
+    
+    # Every range ends today, so the end date is read and formatted once
+    end_date = datetime.date.today()
+    cd_max = end_date.strftime("%m/%d/%Y")
+    start_dates = []
+    urls = []
     for candidate_days in candidate_ranges:
-        end_date = datetime.date.today()
         start_date = end_date - datetime.timedelta(days=candidate_days)
-        url = build_google_news_url(search_term, start_date, end_date, expected_results, location, language)
+        url = _format_google_news_url(encoded_query, start_date.strftime("%m/%d/%Y"), cd_max, query_tail)
         
-        logging.info(f"Generated URL for {candidate_days}-day range:")
-        logging.info(url)
-        
-        headers = {
-            "User-Agent":
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/101.0.4951.54 Safari/537.36"
-        }
+        # Lazy %-style arguments, so the message is only formatted when DEBUG logging is enabled
+        logging.debug("Generated URL for %d-day range: %s", candidate_days, url)
         
+        start_dates.append(start_date)
+        urls.append(url)
+    
+    if single_request:
+        # One request for the widest range, the narrower ranges keep only its recent enough articles
+        widest_page = fetch_news_page(urls[-1], language)
+        pages = [
+            None if widest_page is None else filter_news_by_date(widest_page, start_date)
+            for start_date in start_dates[:-1]
+        ]
+        pages.append(widest_page)
+    else:
+        # The requests are independent, so send all of them at once instead of one after another
+        executor = ThreadPoolExecutor(max_workers=len(urls))
         try:
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Request failed: {e}")
+            futures = [executor.submit(fetch_news_page, url, language) for url in urls]
+            pages = []
+            # Collect in range order and stop at the first range that has enough articles,
+            # without waiting for the wider ranges that will not be used
+            for future in futures:
+                news_results = future.result()
+                pages.append(news_results)
+                if news_results is not None and len(news_results) >= min_results:
+                    break
+        finally:
+            executor.shutdown(wait=False)
+    
+    for candidate_days, start_date, news_results in zip(candidate_ranges, start_dates, pages):
+        if news_results is None:
             continue
         
-        soup = BeautifulSoup(response.content, "html.parser")
-        news_results = []
-        
-        # Use the provided selectors to extract news data
-        for el in soup.select("div.SoaBEf"):
-            try:
-                link = el.find("a")["href"]
-                title = el.select_one("div.MBeuO").get_text() if el.select_one("div.MBeuO") else ""
-                snippet = el.select_one(".GI74Re").get_text() if el.select_one(".GI74Re") else ""
-                date_text = el.select_one(".LfVVr").get_text() if el.select_one(".LfVVr") else ""
-                source = el.select_one(".NUnG9d span").get_text() if el.select_one(".NUnG9d span") else ""
-                
-                news_results.append({
-                    "link": link,
-                    "title": title,
-                    "snippet": snippet,
-                    "date": date_text,
-                    "source": source
-                })
-            except Exception as parse_error:
-                logging.warning(f"Error parsing an element: {parse_error}")
-                continue
-        
         logging.info(f"Found {len(news_results)} articles for a {candidate_days}-day range.")
         if len(news_results) >= min_results or candidate_days == candidate_ranges[-1]:
             final_news = news_results
@@ -131,6 +534,12 @@ def scrape_google_news(search_term, location="co", language="es", min_results=10
         else:
             logging.info("Not enough articles found, expanding the time range...")
 
+    if used_range is None:
+        logging.error(f"No date range could be retrieved for '{search_term}'.")
+        return [], None, None
+    
+    if cache_file is not None and final_news:
+        save_cached_news(cache_file, final_news, used_range[0], used_range[1])
     return final_news, used_range[0], used_range[1]
 
 def generate_report_prompt(news_data, search_term, location, language, start_date, end_date, output_language):
@@ -138,7 +547,7 @@ def generate_report_prompt(news_data, search_term, location, language, start_dat
     Generate a prompt for the LLM to produce a trend report.
     
     Parameters:
-        news_data (list): List of dictionaries containing the scraped news articles.
+        news_data (iterable): Dictionaries containing the scraped news articles (a list or a generator).
         search_term (str): The search term used.
         location (str): The geographic location code.
         language (str): The language code of the news.
@@ -149,40 +558,48 @@ def generate_report_prompt(news_data, search_term, location, language, start_dat
     Returns:
         str: The complete prompt for the LLM.
     """
-    total_articles = len(news_data)
-    # Select the first 3 articles as the "most significant"
-    top_articles = news_data[:3]
-    
-    prompt = f"Generate a professional trend report in {output_language} addressed to {search_term}.\n\n"
-    prompt += f"Report Title: {search_term}\n"
-    prompt += f"Date Range: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}\n"
-    prompt += f"Location: {location}\n"
-    prompt += f"News Language: {language}\n"
-    prompt += f"Total News Articles Analyzed: {total_articles}\n\n"
-    
-    prompt += "Top 3 Most Relevant News Articles:\n"
-    for idx, article in enumerate(top_articles, start=1):
-        prompt += f"{idx}. Title: {article.get('title', '')}\n"
-        prompt += f"   Source: {article.get('source', '')}\n"
-        prompt += f"   Snippet: {article.get('snippet', '')}\n\n"
-    
-    prompt += f"Analyze ALL {total_articles} news articles comprehensively. "
-    prompt += "Generate a detailed report summarizing what has been said about you during the indicated period. "
-    prompt += "The report must be precise, professional, and contain the following details:\n"
-    prompt += " - A summary of predominant trends and opinions across ALL collected news articles.\n"
-    prompt += " - The potential implications of the news for your image and future actions.\n"
-    prompt += " - A comprehensive analysis that goes beyond the top 3 articles.\n\n"
-    prompt += "The report should be written clearly and addressed to you, explaining in detail the analysis performed with the collected information.\n\n"
-    prompt += "IMPORTANT: The output must be in plain text format without any special formatting like bold, italics, or markdown. "
-    prompt += "Write the report as continuous text with appropriate paragraph breaks.\n\n"
-    prompt += "SECTION: TOP 3 MOST SIGNIFICANT ARTICLES (for quick reference)\n"
-    for idx, article in enumerate(top_articles, start=1):
-        prompt += f"{idx}. Comprehensive Summary:\n"
-        prompt += f"   Title: {article.get('title', '')}\n"
-        prompt += f"   Source: {article.get('source', '')}\n"
-        prompt += f"   Key Points: [Provide a concise, insightful summary of the article's main message and potential impact]\n\n"
-    
-    return prompt
+    # Select the first 3 articles as the "most significant" and only count the rest,
+    # so news_data can be any iterable, including a generator
+    articles = iter(news_data)
+    top_articles = list(itertools.islice(articles, 3))
+    total_articles = len(top_articles) + sum(1 for _ in articles)
+    
+    parts = [
+        f"Generate a professional trend report in {output_language} addressed to {search_term}.\n\n",
+        f"Report Title: {search_term}\n",
+        f"Date Range: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}\n",
+        f"Location: {location}\n",
+        f"News Language: {language}\n",
+        f"Total News Articles Analyzed: {total_articles}\n\n",
+        "Top 3 Most Relevant News Articles:\n",
+    ]
+    parts.extend(
+        f"{idx}. Title: {article.get('title', '')}\n"
+        f"   Source: {article.get('source', '')}\n"
+        f"   Snippet: {article.get('snippet', '')}\n\n"
+        for idx, article in enumerate(top_articles, start=1)
+    )
+    parts.extend([
+        f"Analyze ALL {total_articles} news articles comprehensively. ",
+        "Generate a detailed report summarizing what has been said about you during the indicated period. ",
+        "The report must be precise, professional, and contain the following details:\n",
+        " - A summary of predominant trends and opinions across ALL collected news articles.\n",
+        " - The potential implications of the news for your image and future actions.\n",
+        " - A comprehensive analysis that goes beyond the top 3 articles.\n\n",
+        "The report should be written clearly and addressed to you, explaining in detail the analysis performed with the collected information.\n\n",
+        "IMPORTANT: The output must be in plain text format without any special formatting like bold, italics, or markdown. ",
+        "Write the report as continuous text with appropriate paragraph breaks.\n\n",
+        "SECTION: TOP 3 MOST SIGNIFICANT ARTICLES (for quick reference)\n",
+    ])
+    parts.extend(
+        f"{idx}. Comprehensive Summary:\n"
+        f"   Title: {article.get('title', '')}\n"
+        f"   Source: {article.get('source', '')}\n"
+        f"   Key Points: [Provide a concise, insightful summary of the article's main message and potential impact]\n\n"
+        for idx, article in enumerate(top_articles, start=1)
+    )
+    
+    return "".join(parts)
 
 def create_folder_structure(base_folder, search_term):
     """
@@ -200,6 +617,206 @@ def create_folder_structure(base_folder, search_term):
         os.makedirs(reports_folder)
     return reports_folder
 
+def save_news_data(news_data, filename):
+    """
+    Save the scraped news articles to a JSON file.
+    
+    Uses orjson when it is installed and falls back to the standard json module otherwise.
+    
+    Parameters:
+        news_data (list): List of dictionaries containing the scraped news articles.
+        filename (str): Path of the JSON file to write.
+    """
+    if orjson is not None:
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(news_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(news_data, f, ensure_ascii=False, indent=2)
+
+def write_file_atomically(path, content):
+    """
+    Write text to a file so that readers never see a partially written file.
+    
+    Parameters:
+        path (str): Destination file path.
+        content (str): The text to write.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+def get_embedder():
+    """
+    Load the Sentence-BERT model used by the semantic report cache.
+    
+    Returns:
+        SentenceTransformer or None: The embedding model, or None if sentence_transformers is not installed.
+    """
+    global _embedder
+    # Reports are generated from several threads, only the first one loads the model
+    with _embedder_lock:
+        if _embedder is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                logging.info("sentence_transformers is not installed, semantic report caching is disabled.")
+                _embedder = False
+            else:
+                _embedder = SentenceTransformer(SEMANTIC_CACHE_MODEL)
+    return _embedder or None
+
+def embed_news_titles(news_data):
+    """
+    Embed the titles of a news set for the semantic report cache.
+    
+    Each title is embedded on its own and the results are mean-pooled, so every article
+    counts (a single joined string would be cut off at the model's 256 word pieces).
+    
+    Parameters:
+        news_data (list): List of dictionaries containing the scraped news articles.
+        
+    Returns:
+        list or None: The normalized embedding, or None if no embedding model is available.
+    """
+    titles = [article.get("title", "") for article in news_data]
+    embedder = get_embedder() if titles else None
+    if embedder is None:
+        return None
+    mean = embedder.encode(titles, normalize_embeddings=True).mean(axis=0)
+    return (mean / float((mean ** 2).sum()) ** 0.5).tolist()
+
+def load_semantic_index(index_path):
+    """
+    Load the semantic cache entries stored for one search term, model and output language.
+    
+    Parameters:
+        index_path (str): Path to the semantic index JSON file.
+        
+    Returns:
+        list: Entries with "embedding", "report", "total_articles", "start_date" and "end_date" keys, most recent last.
+    """
+    if not os.path.exists(index_path):
+        return []
+    with open(index_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def find_similar_report(entries, embedding, total_articles, start_date, end_date):
+    """
+    Find the cached report whose news embedding is most similar to the given one.
+    
+    Only reports built from the same number of articles over the same date range are
+    considered, since the report states both.
+    
+    Parameters:
+        entries (list): Entries returned by load_semantic_index.
+        embedding (list): Normalized embedding of the current news titles.
+        total_articles (int): Number of articles in the current news set.
+        start_date (datetime.date): The start date of the news collection.
+        end_date (datetime.date): The end date of the news collection.
+        
+    Returns:
+        str or None: The cached report if its similarity reaches SEMANTIC_CACHE_THRESHOLD, otherwise None.
+    """
+    best_score, best_report = 0.0, None
+    for entry in entries:
+        if (entry.get("total_articles"), entry.get("start_date"), entry.get("end_date")) != (
+            total_articles, start_date.isoformat(), end_date.isoformat()
+        ):
+            continue
+        # Embeddings are normalized, so the dot product is the cosine similarity
+        score = sum(a * b for a, b in zip(entry["embedding"], embedding))
+        if score > best_score:
+            best_score, best_report = score, entry["report"]
+    if best_score >= SEMANTIC_CACHE_THRESHOLD:
+        return best_report
+    return None
+
+def generate_trend_report(model, report_prompt, cache_folder, news_data, search_term, output_language,
+                          start_date, end_date):
+    """
+    Generate a trend report with an Ollama model, reusing a cached report when the
+    same model has already answered the exact same prompt or a prompt built from a
+    nearly identical set of news.
+    
+    Parameters:
+        model (str): The Ollama model name (e.g., "llama3.2:3b").
+        report_prompt (str): The prompt produced by generate_report_prompt.
+        cache_folder (str): Folder where generated reports are cached.
+        news_data (list): The news articles the prompt was built from.
+        search_term (str): The search term used.
+        output_language (str): The language the report is written in.
+        start_date (datetime.date): The start date of the news collection.
+        end_date (datetime.date): The end date of the news collection.
+        
+    Returns:
+        str: The generated trend report.
+    """
+    cache_key = hashlib.sha256(f"{model}\x00{report_prompt}".encode("utf-8")).hexdigest()
+    cache_path = os.path.join(cache_folder, f"{cache_key}.txt")
+    
+    if os.path.exists(cache_path):
+        logging.info(f"Reusing cached trend report from {model}.")
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return f.read()
+    
+    # Fall back to a semantic match against reports generated for earlier news sets
+    index_path = os.path.join(
+        cache_folder,
+        f"semantic_{to_snake_case(search_term)}_{to_snake_case(model)}_{to_snake_case(output_language)}.json"
+    )
+    embedding = embed_news_titles(news_data)
+    if embedding is not None:
+        entries = load_semantic_index(index_path)
+        similar_report = find_similar_report(entries, embedding, len(news_data), start_date, end_date)
+        if similar_report is not None:
+            logging.info(f"Reusing semantically similar trend report from {model}.")
+            return similar_report
+    
+    # Initialize the specific LLM and invoke it with the prompt; LangChain is only loaded when a report is generated
+    from langchain_ollama import OllamaLLM
+    
+    llm = OllamaLLM(model=model)
+    trend_report = llm.invoke(report_prompt)
+    
+    os.makedirs(cache_folder, exist_ok=True)
+    write_file_atomically(cache_path, trend_report)
+    if embedding is not None:
+        entries.append({
+            "embedding": embedding,
+            "report": trend_report,
+            "total_articles": len(news_data),
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat()
+        })
+        write_file_atomically(index_path, json.dumps(entries[-SEMANTIC_CACHE_MAX_ENTRIES:], ensure_ascii=False))
+    return trend_report
+
+def save_trend_report(model, report_prompt, report_filename, cache_folder, news_data, search_term, output_language,
+                      start_date, end_date):
+    """
+    Generate a trend report with one LLM and save it to a text file.
+    
+    Parameters:
+        model (str): The Ollama model name (e.g., "llama3.2:3b").
+        report_prompt (str): The prompt produced by generate_report_prompt.
+        report_filename (str): Path of the text file to write.
+        cache_folder (str): Folder where generated reports are cached.
+        news_data (list): The news articles the prompt was built from.
+        search_term (str): The search term used.
+        output_language (str): The language the report is written in.
+        start_date (datetime.date): The start date of the news collection.
+        end_date (datetime.date): The end date of the news collection.
+    """
+    # Invoke the model with the prompt to generate the trend report
+    trend_report = generate_trend_report(
+        model, report_prompt, cache_folder, news_data, search_term, output_language, start_date, end_date
+    )
+    
+    with open(report_filename, "w", encoding="utf-8") as f:
+        f.write(trend_report)
+
 if __name__ == "__main__":
     # Set parameters for scraping:
     search_term = "Donald Trump"
@@ -213,6 +830,7 @@ if __name__ == "__main__":
     # Define base folder for reports
     base_folder = "reports"
     reports_folder = create_folder_structure(base_folder, search_term)
+    cache_folder = os.path.join(reports_folder, ".cache")
     
     # Scrape Google News
     news_data, start_date, end_date = scrape_google_news(
@@ -231,8 +849,7 @@ if __name__ == "__main__":
             f"{to_snake_case(search_term)}_{start_str}_{end_str}_{current_time}_en.json"
         )
         
-        with open(json_filename, "w", encoding="utf-8") as f:
-            json.dump(news_data, f, ensure_ascii=False, indent=2)
+        save_news_data(news_data, json_filename)
         
         logging.info(f"Scraping complete. {len(news_data)} news articles saved to {json_filename}.")
         
@@ -250,27 +867,27 @@ if __name__ == "__main__":
                 news_data, search_term, location, language, start_date, end_date, output_language
             )
             
-            # Generate reports with each LLM
-            for llm_info in llm_list:
-                try:
-                    # Initialize the specific LLM
-                    llm = OllamaLLM(model=llm_info["model"])
-                    
-                    # Invoke the model with the prompt to generate the trend report
-                    trend_report = llm.invoke(report_prompt)
-                    
+            # Generate reports with every LLM at once, each model call is an independent request to Ollama
+            with ThreadPoolExecutor(max_workers=len(llm_list)) as executor:
+                futures = {}
+                for llm_info in llm_list:
                     # Save the generated trend report to a text file with LLM name and language in filename
                     report_filename = os.path.join(
                         reports_folder,
                         f"{to_snake_case(search_term)}_trend_report_{start_str}_{end_str}_{current_time}_{llm_info['name'].replace(':', '_')}_{output_language}.txt"
                     )
-                    
-                    with open(report_filename, "w", encoding="utf-8") as f:
-                        f.write(trend_report)
-                    
-                    logging.info(f"Trend report generated using {llm_info['name']} in {output_language} and saved to {report_filename}.")
-                    
-                except Exception as e:
-                    logging.error(f"Error generating report with {llm_info['name']} in {output_language}: {e}")
+                    future = executor.submit(
+                        save_trend_report, llm_info["model"], report_prompt, report_filename,
+                        cache_folder, news_data, search_term, output_language, start_date, end_date
+                    )
+                    futures[future] = (llm_info, report_filename)
+                
+                for future in as_completed(futures):
+                    llm_info, report_filename = futures[future]
+                    try:
+                        future.result()
+                        logging.info(f"Trend report generated using {llm_info['name']} in {output_language} and saved to {report_filename}.")
+                    except Exception as e:
+                        logging.error(f"Error generating report with {llm_info['name']} in {output_language}: {e}")
     else:
         logging.info("No news articles were retrieved.")
\ No newline at end of file